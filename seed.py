@@ -3,7 +3,15 @@ Database seeding script.
 
 Run this to populate the database with sample data for development/testing.
 """
-from datetime import datetime, timedelta, date
+import functools
+import itertools
+import json
+import sys
+from datetime import datetime, time, timedelta, date
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Tuple
+
+from sqlalchemy import insert
 from sqlmodel import Session, create_engine, select, text
 
 from app.config import settings
@@ -14,10 +22,260 @@ from app.models.favorite import Favorite
 from app.models.search_history import SearchHistory
 from app.models.cast import Cast
 from app.models.ticket import Ticket
-from app.services.auth import get_password_hash
 from sqlmodel import SQLModel
 
 
+# Precomputed ``get_password_hash`` output for the fixed seed passwords, so
+# reseeding does not pay for bcrypt key derivation on every run.
+_ADMIN_HASH = "$2b$12$PUscq7GGT9rDnIgk/CK.sueZ6kW2D55Nco4hn52kEYpb/4h36uGoy"  # admin123
+_DEMO_HASH = "$2b$12$2X3AzCT.W.egQks0G/81cuLGXV5hVTsghv2p7RU1epfn.NoH2RBlW"  # demo123
+_PASSWORD123_HASH = "$2b$12$74z.hoGVey6m1R.m15BFZeAdohp1Wl9aVnb7bQQb72JjEab7n3puK"  # password123
+
+SEED_DATA_DIR = Path(__file__).resolve().parent / "seed_data"
+
+
+class MovieRow(NamedTuple):
+    """One seed movie; array fields are tuples so rows can share their values."""
+    title: str
+    description: str
+    duration_minutes: int
+    genre: str
+    rating: str
+    cast: Tuple[str, ...]
+    director: str
+    writers: Tuple[str, ...]
+    producers: Tuple[str, ...]
+    release_date: date
+    country: str
+    language: str
+    budget: int
+    revenue: int
+    production_company: str
+    distributor: str
+    image_url: str
+    trailer_url: str
+    awards: Tuple[str, ...]
+    details: Dict[str, Any]
+
+
+_INTERNED_FIELDS = (
+    "genre", "rating", "director", "country", "language", "production_company", "distributor",
+)
+_INTERNED_LIST_FIELDS = ("cast", "writers", "producers", "awards")
+
+
+def _load_seed_file(name, build):
+    """Return ``build(records)`` for the records in ``seed_data/<name>.json``."""
+    return build(json.loads((SEED_DATA_DIR / f"{name}.json").read_bytes()))
+
+
+def _build_movie_rows(movies):
+    """Convert parsed movie records into a tuple of ``MovieRow``."""
+    release_dates = {}  # ISO string -> date, so repeated dates share one object
+    shared_tuples = {}  # Identical cast/writers/producers/awards share one tuple
+    for movie in movies:
+        iso_date = movie["release_date"]
+        if iso_date not in release_dates:
+            release_dates[iso_date] = date.fromisoformat(iso_date)
+        movie["release_date"] = release_dates[iso_date]
+        # Titles are the join key for cast and reviews; interning them makes
+        # those lookups pointer compares
+        movie["title"] = sys.intern(movie["title"])
+        # Low-cardinality values repeat across rows; share one string object each
+        for field in _INTERNED_FIELDS:
+            movie[field] = sys.intern(movie[field])
+        for field in _INTERNED_LIST_FIELDS:
+            values = tuple(sys.intern(value) for value in movie[field])
+            movie[field] = shared_tuples.setdefault(values, values)
+    return tuple(MovieRow(**movie) for movie in movies)
+
+
+@functools.cache
+def _load_movies():
+    """
+    Load the seed movies from ``seed_data/movies.json`` as a tuple of ``MovieRow``.
+
+    Nothing is read at import time; the first call loads the records and later
+    calls return the same tuple.
+    """
+    return _load_seed_file("movies", _build_movie_rows)
+
+
+@functools.cache
+def _load_cast():
+    """
+    Load the seed cast from ``seed_data/cast.json``.
+
+    Returns ``(movie title, actor, character, is_lead, order, profile image)`` tuples
+    whose movie titles and actor names are interned like the movie titles.
+    """
+    return _load_seed_file("cast", lambda members: [
+        (
+            sys.intern(member["movie"]),
+            sys.intern(member["actor_name"]),
+            member["character_name"],
+            member["is_lead"],
+            member["order"],
+            member["profile_image_url"],
+        )
+        for member in members
+    ])
+
+
+@functools.cache
+def _load_cinemas():
+    """
+    Load the seed cinemas from ``seed_data/cinemas.json``.
+
+    Returns ``(cinema columns, room names)`` pairs; each cinema's rooms are
+    listed with it so rooms can be derived from the returned cinema ids.
+    """
+    return _load_seed_file("cinemas", lambda cinemas: tuple(
+        ({column: value for column, value in cinema.items() if column != "rooms"}, tuple(cinema["rooms"]))
+        for cinema in cinemas
+    ))
+
+
+def _released_movie_ids(movie_ids, release_dates, today):
+    """Return the ids in ``movie_ids`` whose release date is on or before ``today``."""
+    return [
+        movie_id
+        for movie_id, release_date in zip(movie_ids, release_dates)
+        if release_date <= today
+    ]
+
+
+def _copy_value(value):
+    """Render a single value in PostgreSQL's COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, (int, float, date)):
+        return str(value)  # Never contains COPY metacharacters, no escaping needed
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+class _CopyStream:
+    """Read-only file object that renders rows for COPY as they are consumed."""
+
+    def __init__(self, rows):
+        self._lines = ("\t".join(map(_copy_value, row)) + "\n" for row in rows)
+        self._buffer = ""
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            self._buffer += line
+        if size < 0:
+            size = len(self._buffer)
+        chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+
+def _copy_rows(session, model, columns, rows):
+    """
+    Bulk-load ``rows`` (tuples ordered like ``columns``) into the table of ``model``.
+
+    On PostgreSQL the rows are streamed through ``COPY ... FROM STDIN`` so the
+    iterable is never materialized; other backends fall back to one executemany INSERT.
+    """
+    table = model.__table__
+    connection = session.connection()
+    if connection.dialect.name != "postgresql":
+        params = [dict(zip(columns, row)) for row in rows]
+        # An empty parameter list would run a single INSERT of column defaults
+        if params:
+            session.execute(insert(table), params)
+        return
+
+    preparer = connection.dialect.identifier_preparer
+    column_list = ", ".join(preparer.quote(column) for column in columns)
+    with connection.connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {preparer.format_table(table)} ({column_list}) FROM STDIN",
+            _CopyStream(rows),
+        )
+
+
+def _insert_movies(session, movies):
+    """Insert the ``MovieRow`` records in ``movies`` and return their ids in input order."""
+    return session.execute(
+        insert(Movie).returning(Movie.id, sort_by_parameter_order=True),
+        [movie._asdict() for movie in movies],
+    ).scalars().all()
+
+
+def _seat_layout(room_name):
+    """Return ``(rows, seats_per_row)`` for a room based on its name."""
+    # IMAX and 4DX: 12 rows x 20 seats, Premium: 10 rows x 16 seats, Standard: 8 rows x 12 seats
+    if "IMAX" in room_name or "4DX" in room_name:
+        return 12, 20
+    if "Premium" in room_name:
+        return 10, 16
+    return 8, 12
+
+
+# Morning, afternoon, evening, night showtimes and their surcharge;
+# evening/night shows cost more
+_SHOWTIME_SURCHARGES = {10: 0.0, 14: 0.0, 18: 3.0, 21: 3.0}
+
+
+def _room_base_price(room_name):
+    """Return the base ticket price for a room based on its name."""
+    # IMAX/Premium rooms cost more, 4DX the most
+    if "IMAX" in room_name or "Premium" in room_name:
+        return 20.0
+    if "4DX" in room_name:
+        return 25.0
+    return 15.0
+
+
+# Seat row labels: A-Z, then AA-AZ for rooms deeper than 26 rows
+ROW_LABELS = tuple(chr(65 + i) for i in range(26)) + tuple(f"A{chr(65 + i)}" for i in range(26))
+
+
+@functools.cache
+def _seat_coords(rows, seats_per_row, all_vip):
+    """Return ``(row_label, seat_number, seat_type)`` for every seat of a room layout."""
+    # VIP rooms: all VIP seats, others: last 2 rows are VIP
+    return tuple(
+        (ROW_LABELS[row_num], seat_num, "vip" if all_vip or row_num >= rows - 2 else "standard")
+        for row_num in range(rows)
+        for seat_num in range(1, seats_per_row + 1)
+    )
+
+
+def _iter_seat_rows(rooms):
+    """Yield ``(room_id, row_label, seat_number, seat_type)`` for every seat of ``rooms``."""
+    for room in rooms:
+        # Rooms sharing a layout share one precomputed coordinate tuple
+        for coords in _seat_coords(*_seat_layout(room.name), "VIP" in room.name):
+            yield (room.id, *coords)
+
+
+def clear_database(session):
+    """Delete every row from the application tables, leaving the schema in place."""
+    tables = SQLModel.metadata.sorted_tables
+    connection = session.connection()
+    if connection.dialect.name == "postgresql":
+        # One TRUNCATE empties every table regardless of FK order and restarts
+        # the id sequences, so reseeded ids (e.g. the sample ticket seats) line up
+        preparer = connection.dialect.identifier_preparer
+        table_list = ", ".join(preparer.format_table(table) for table in tables)
+        session.exec(text(f"TRUNCATE {table_list} RESTART IDENTITY CASCADE"))
+    else:
+        # Children before parents so foreign keys never dangle
+        for table in reversed(tables):
+            session.execute(table.delete())
+    session.commit()
+
 
 def seed_database():
     """Seed the database with sample data."""
@@ -29,14 +287,19 @@ def seed_database():
         if existing_cinema:
            print("⚠️  Database already contains data. Skipping seed.")
            return
+
+        # The whole seed is one transaction; a seed lost to a crash can simply be
+        # rerun, so don't make the final commit wait for the WAL flush
+        if session.connection().dialect.name == "postgresql":
+            session.exec(text("SET LOCAL synchronous_commit = OFF"))
         
         # Create sample users
         print("👤 Creating sample users...")
-        users = [
-            User(
+        user_rows = [
+            dict(
                 email="admin@cinema.com",
                 full_name="Admin User",
-                hashed_password=get_password_hash("admin123"),
+                hashed_password=_ADMIN_HASH,
                 is_active=True,
                 is_admin=True,
                 date_of_birth=datetime(1985, 3, 20),
@@ -44,10 +307,10 @@ def seed_database():
                 notifications_enabled=True,
                 newsletter_subscribed=False
             ),
-            User(
+            dict(
                 email="demo@cinema.com",
                 full_name="Demo User",
-                hashed_password=get_password_hash("demo123"),
+                hashed_password=_DEMO_HASH,
                 is_active=True,
                 is_admin=False,
                 date_of_birth=datetime(1990, 1, 15),
@@ -55,10 +318,10 @@ def seed_database():
                 notifications_enabled=True,
                 newsletter_subscribed=True
             ),
-            User(
+            dict(
                 email="john.doe@example.com",
                 full_name="John Doe",
-                hashed_password=get_password_hash("password123"),
+                hashed_password=_PASSWORD123_HASH,
                 is_active=True,
                 is_admin=False,
                 date_of_birth=datetime(1995, 7, 8),
@@ -66,10 +329,10 @@ def seed_database():
                 notifications_enabled=True,
                 newsletter_subscribed=True
             ),
-            User(
+            dict(
                 email="jane.smith@example.com",
                 full_name="Jane Smith",
-                hashed_password=get_password_hash("password123"),
+                hashed_password=_PASSWORD123_HASH,
                 is_active=True,
                 is_admin=False,
                 date_of_birth=datetime(1988, 11, 22),
@@ -79,693 +342,253 @@ def seed_database():
             )
         ]
 
-        for user in users:
-            session.add(user)
-        session.commit()
+        # RETURNING hands back the generated ids with the INSERT itself, so the
+        # users need no flush or refresh before reviews and tickets reference them
+        users = session.execute(
+            insert(User).returning(User.id, sort_by_parameter_order=True),
+            user_rows,
+        ).all()
 
-        for user in users:
-            session.refresh(user)
-            print(f"   ✓ Created user: {user.email} (Admin: {user.is_admin})")
+        print(f"   ✓ Created {len(users)} users")
         
         # Create cinemas
         print("\n🎬 Creating cinemas...")
-        cinemas = [
-            Cinema(
-                name="Mega Cinema Tunis",
-                address="123 Avenue Habib Bourguiba",
-                city="Tunis",
-                longitude=10.1815,
-                latitude=36.8065,
-                imageurl="https://images.unsplash.com/photo-1489599849927-2ee91cede3ba",
-                phone="+216 71 123 456",
-                hasParking=True,
-                isAccessible=True,
-                amenities=["3D", "IMAX", "Dolby Atmos", "Parking", "Restaurant", "VIP Lounge"]
-            ),
-            Cinema(
-                name="Pathé Palace",
-                address="456 Avenue de la Liberté",
-                city="Tunis",
-                longitude=10.1658,
-                latitude=36.8189,
-                imageurl="https://images.unsplash.com/photo-1478720568477-152d9b164e26",
-                phone="+216 71 789 012",
-                hasParking=True,
-                isAccessible=False,
-                amenities=["3D", "Dolby Atmos", "Snack Bar", "Online Booking"]
-            ),
-            Cinema(
-                name="Ciné Carthage",
-                address="789 Avenue de Carthage",
-                city="Tunis",
-                longitude=10.1975,
-                latitude=36.8520,
-                imageurl="https://images.unsplash.com/photo-1594909122845-11baa439b7bf",
-                phone="+216 71 345 678",
-                hasParking=False,
-                isAccessible=True,
-                amenities=["3D", "Premium Seats", "Snack Bar"]
-            ),
-            Cinema(
-                name="Galaxy Cinema Sousse",
-                address="22 Boulevard 14 Janvier",
-                city="Sousse",
-                longitude=10.6408,
-                latitude=35.8256,
-                imageurl="https://images.unsplash.com/photo-1536440136628-849c177e76a1",
-                phone="+216 73 456 789",
-                hasParking=True,
-                isAccessible=True,
-                amenities=["3D", "4DX", "Dolby Atmos", "Parking", "Restaurant"]
-            ),
-            Cinema(
-                name="Cinépolis Sfax",
-                address="88 Avenue Majida Boulila",
-                city="Sfax",
-                longitude=10.7602,
-                latitude=34.7406,
-                imageurl="https://images.unsplash.com/photo-1598899134739-24c46f58b8c0",
-                phone="+216 74 567 890",
-                hasParking=True,
-                isAccessible=False,
-                amenities=["3D", "IMAX", "Luxury Recliners", "Parking"]
-            )
-        ]
-        
-        for cinema in cinemas:
-            session.add(cinema)
-        session.commit()
-        
-        for cinema in cinemas:
-            session.refresh(cinema)
-            print(f"   ✓ Created cinema: {cinema.name}")
+        seed_cinemas = _load_cinemas()
+        cinemas = session.execute(
+            insert(Cinema).returning(Cinema.id, Cinema.city, sort_by_parameter_order=True),
+            [columns for columns, _ in seed_cinemas],
+        ).all()
+
+        print(f"   ✓ Created {len(cinemas)} cinemas")
         
         # Create rooms for all cinemas
         print("\n🚪 Creating rooms...")
-        rooms = [
-            # Mega Cinema Tunis - 3 rooms
-            Room(name="Room 1", cinema_id=cinemas[0].id),
-            Room(name="Room 2", cinema_id=cinemas[0].id),
-            Room(name="IMAX Hall", cinema_id=cinemas[0].id),
-            # Pathé Palace - 2 rooms
-            Room(name="Hall A", cinema_id=cinemas[1].id),
-            Room(name="Hall B", cinema_id=cinemas[1].id),
-            # Ciné Carthage - 2 rooms
-            Room(name="Salle 1", cinema_id=cinemas[2].id),
-            Room(name="Salle 2", cinema_id=cinemas[2].id),
-            # Galaxy Cinema Sousse - 3 rooms
-            Room(name="Screen 1", cinema_id=cinemas[3].id),
-            Room(name="Screen 2", cinema_id=cinemas[3].id),
-            Room(name="4DX Screen", cinema_id=cinemas[3].id),
-            # Cinépolis Sfax - 2 rooms
-            Room(name="Premium 1", cinema_id=cinemas[4].id),
-            Room(name="IMAX Sfax", cinema_id=cinemas[4].id),
+        # Parents first, then children: the cinema ids returned above key every room
+        room_rows = [
+            {"name": room_name, "cinema_id": cinema.id}
+            for cinema, (_, room_names) in zip(cinemas, seed_cinemas)
+            for room_name in room_names
         ]
-        
-        for room in rooms:
-            session.add(room)
-        session.commit()
-        
-        for room in rooms:
-            session.refresh(room)
-            print(f"   ✓ Created room: {room.name} in {[c for c in cinemas if c.id == room.cinema_id][0].name}")
+
+        # One executemany; RETURNING gives each room's id back in input order,
+        # so no per-room refresh is needed before the seats reference them
+        rooms = session.execute(
+            insert(Room).returning(Room.id, Room.name, sort_by_parameter_order=True),
+            room_rows,
+        ).all()
+
+        print(f"   ✓ Created {len(rooms)} rooms")
         
         # Create seats for each room
         print("\n💺 Creating seats...")
+        _copy_rows(
+            session,
+            Seat,
+            ("room_id", "row_label", "seat_number", "seat_type"),
+            _iter_seat_rows(rooms),
+        )
+
         total_seats = 0
         for room in rooms:
-            # IMAX and 4DX: 12 rows x 20 seats, Premium: 10 rows x 16 seats, Standard: 8 rows x 12 seats
-            if "IMAX" in room.name or "4DX" in room.name:
-                rows = 12
-                seats_per_row = 20
-            elif "Premium" in room.name:
-                rows = 10
-                seats_per_row = 16
-            else:
-                rows = 8
-                seats_per_row = 12
-
-            for row_num in range(rows):
-                row_label = chr(65 + row_num) if row_num < 26 else f"A{chr(65 + row_num - 26)}"
-
-                for seat_num in range(1, seats_per_row + 1):
-                    # VIP rooms: all VIP seats, others: last 2 rows are VIP
-                    if "VIP" in room.name:
-                        seat_type = "vip"
-                    else:
-                        seat_type = "vip" if row_num >= rows - 2 else "standard"
-                    seat = Seat(
-                        room_id=room.id,
-                        row_label=row_label,
-                        seat_number=seat_num,
-                        seat_type=seat_type
-                    )
-                    session.add(seat)
-                    total_seats += 1
-
-            print(f"   ✓ Created {rows * seats_per_row} seats for {room.name}")
-
-        session.commit()
-        print(f"   Total seats created: {total_seats}")
-
-        # Updated movies with newer release dates
-        print("\n🎥 Creating movies with newer release dates...")
-        movies = [
-            Movie(
-                title="Avatar: The Way of Water",
-                description="Jake Sully lives with his newfound family formed on Pandora...",
-                duration_minutes=192,
-                genre="Sci-Fi",
-                rating="PG-13",
-                cast=["Sam Worthington", "Zoe Saldaña", "Sigourney Weaver"],
-                director="James Cameron",
-                writers=["James Cameron"],
-                producers=["Jon Landau"],
-                release_date=date(2022, 12, 16),  # newer date
-                country="USA",
-                language="English",
-                budget=250000000,
-                revenue=2300000000,
-                production_company="20th Century Studios",
-                distributor="20th Century Studios",
-                image_url="https://image.tmdb.org/t/p/w500/t6HIqrRAclMCA60NsSmeqe9RmNV.jpg",
-                trailer_url="https://www.youtube.com/watch?v=d9MyW72ELq0",
-                awards=[],
-                details={"imdb_rating": 7.8}
-            ),
-            Movie(
-                title="Oppenheimer",
-                description="The story of J. Robert Oppenheimer and the creation of the atomic bomb...",
-                duration_minutes=180,
-                genre="Biography",
-                rating="PG-13",
-                cast=["Cillian Murphy", "Emily Blunt", "Matt Damon"],
-                director="Christopher Nolan",
-                writers=["Christopher Nolan"],
-                producers=["Emma Thomas", "Christopher Nolan"],
-                release_date=date(2023, 7, 21),  # newer date
-                country="USA",
-                language="English",
-                budget=100000000,
-                revenue=900000000,
-                production_company="Universal Pictures",
-                distributor="Universal Pictures",
-                image_url="https://image.tmdb.org/t/p/w500/FiQkXn0i6HsqZfXb4Kt8fhFIdHg.jpg",
-                trailer_url="https://www.youtube.com/watch?v=QPdIXok6GOs",
-                awards=[],
-                details={"imdb_rating": 8.5}
-            ),
-        ]
+            rows, seats_per_row = _seat_layout(room.name)
+            total_seats += rows * seats_per_row
+        print(f"   ✓ Created {total_seats} seats across {len(rooms)} rooms")
 
         # Create movies with comprehensive details
         print("\n🎥 Creating movies...")
-        movies = [
-            Movie(
-                title="The Matrix",
-                description="A computer hacker learns about the true nature of reality and his role in the war against its controllers.",
-                duration_minutes=136,
-                genre="Sci-Fi",
-                rating="R",
-                cast=["Keanu Reeves", "Laurence Fishburne", "Carrie-Anne Moss", "Hugo Weaving"],
-                director="The Wachowskis",
-                writers=["The Wachowskis"],
-                producers=["Joel Silver"],
-                release_date=date(1999, 3, 31),
-                country="USA",
-                language="English",
-                budget=63000000,
-                revenue=466364845,
-                production_company="Warner Bros. Pictures",
-                distributor="Warner Bros. Pictures",
-                image_url="https://image.tmdb.org/t/p/w500/f89U3ADr1oiB1s9GkdPOEpXUk5H.jpg",
-                trailer_url="https://www.youtube.com/watch?v=vKQi3bBA1y8",
-                awards=["Academy Award for Best Visual Effects", "Academy Award for Best Film Editing"],
-                details={"trilogy": "The Matrix Trilogy", "part": 1}
-            ),
-            Movie(
-                title="Inception",
-                description="A thief who steals corporate secrets through dream-sharing technology is given the inverse task of planting an idea.",
-                duration_minutes=148,
-                genre="Sci-Fi",
-                rating="PG-13",
-                cast=["Leonardo DiCaprio", "Joseph Gordon-Levitt", "Ellen Page", "Tom Hardy", "Marion Cotillard"],
-                director="Christopher Nolan",
-                writers=["Christopher Nolan"],
-                producers=["Emma Thomas", "Christopher Nolan"],
-                release_date=date(2010, 7, 16),
-                country="USA",
-                language="English",
-                budget=160000000,
-                revenue=836848102,
-                production_company="Warner Bros. Pictures",
-                distributor="Warner Bros. Pictures",
-                image_url="https://image.tmdb.org/t/p/w500/9gk7adHYeDvHkCSEqAvQNLV5Uge.jpg",
-                trailer_url="https://www.youtube.com/watch?v=YoHD9XEInc0",
-                awards=["Academy Award for Best Cinematography", "Academy Award for Best Sound Mixing"],
-                details={"imdb_rating": 8.8, "metascore": 74}
-            ),
-            Movie(
-                title="The Dark Knight",
-                description="When the menace known as the Joker wreaks havoc on Gotham, Batman must accept one of the greatest tests.",
-                duration_minutes=152,
-                genre="Action",
-                rating="PG-13",
-                cast=["Christian Bale", "Heath Ledger", "Aaron Eckhart", "Michael Caine", "Gary Oldman"],
-                director="Christopher Nolan",
-                writers=["Jonathan Nolan", "Christopher Nolan"],
-                producers=["Emma Thomas", "Charles Roven"],
-                release_date=date(2008, 7, 18),
-                country="USA",
-                language="English",
-                budget=185000000,
-                revenue=1004558444,
-                production_company="Warner Bros. Pictures",
-                distributor="Warner Bros. Pictures",
-                image_url="https://image.tmdb.org/t/p/w500/qJ2tW6WMUDux911r6m7haRef0WH.jpg",
-                trailer_url="https://www.youtube.com/watch?v=EXeTwQWrcwY",
-                awards=["Academy Award for Best Supporting Actor (Heath Ledger)", "Academy Award for Best Sound Editing"],
-                details={"trilogy": "The Dark Knight Trilogy", "part": 2, "imdb_rating": 9.0}
-            ),
-            Movie(
-                title="Interstellar",
-                description="A team of explorers travel through a wormhole in space in an attempt to ensure humanity's survival.",
-                duration_minutes=169,
-                genre="Sci-Fi",
-                rating="PG-13",
-                cast=["Matthew McConaughey", "Anne Hathaway", "Jessica Chastain", "Michael Caine", "Matt Damon"],
-                director="Christopher Nolan",
-                writers=["Jonathan Nolan", "Christopher Nolan"],
-                producers=["Emma Thomas", "Christopher Nolan", "Lynda Obst"],
-                release_date=date(2014, 11, 7),
-                country="USA",
-                language="English",
-                budget=165000000,
-                revenue=677471339,
-                production_company="Paramount Pictures",
-                distributor="Paramount Pictures",
-                image_url="https://image.tmdb.org/t/p/w500/gEU2QniE6E77NI6lCU6MxlNBvIx.jpg",
-                trailer_url="https://www.youtube.com/watch?v=zSWdZVtXT7E",
-                awards=["Academy Award for Best Visual Effects"],
-                details={"imdb_rating": 8.6, "score_composer": "Hans Zimmer"}
-            ),
-            Movie(
-                title="Pulp Fiction",
-                description="The lives of two mob hitmen, a boxer, a gangster and his wife intertwine in four tales of violence.",
-                duration_minutes=154,
-                genre="Crime",
-                rating="R",
-                cast=["John Travolta", "Samuel L. Jackson", "Uma Thurman", "Bruce Willis", "Ving Rhames"],
-                director="Quentin Tarantino",
-                writers=["Quentin Tarantino", "Roger Avary"],
-                producers=["Lawrence Bender"],
-                release_date=date(1994, 10, 14),
-                country="USA",
-                language="English",
-                budget=8000000,
-                revenue=213928762,
-                production_company="Miramax Films",
-                distributor="Miramax Films",
-                image_url="https://image.tmdb.org/t/p/w500/d5iIlFn5s0ImszYzBPb8JPIfbXD.jpg",
-                trailer_url="https://www.youtube.com/watch?v=s7EdQ4FqbhY",
-                awards=["Academy Award for Best Original Screenplay", "Palme d'Or at Cannes"],
-                details={"imdb_rating": 8.9, "non_linear_narrative": True}
-            ),
-            Movie(
-                title="Parasite",
-                description="Greed and class discrimination threaten the newly formed symbiotic relationship between the wealthy Park family and the destitute Kim clan.",
-                duration_minutes=132,
-                genre="Thriller",
-                rating="R",
-                cast=["Song Kang-ho", "Lee Sun-kyun", "Cho Yeo-jeong", "Choi Woo-shik", "Park So-dam"],
-                director="Bong Joon-ho",
-                writers=["Bong Joon-ho", "Han Jin-won"],
-                producers=["Kwak Sin-ae", "Moon Yang-kwon"],
-                release_date=date(2019, 5, 30),
-                country="South Korea",
-                language="Korean",
-                budget=11400000,
-                revenue=258800000,
-                production_company="CJ Entertainment",
-                distributor="CJ Entertainment",
-                image_url="https://image.tmdb.org/t/p/w500/7IiTTgloJzvGI1TAYymCfbfl3vT.jpg",
-                trailer_url="https://www.youtube.com/watch?v=5xH0HfJHsaY",
-                awards=["Academy Award for Best Picture", "Academy Award for Best Director", "Palme d'Or"],
-                details={"imdb_rating": 8.5, "first_korean_best_picture": True}
-            ),
-            Movie(
-                title="Avengers: Endgame",
-                description="After the devastating events of Infinity War, the Avengers assemble once more to reverse Thanos' actions and restore balance to the universe.",
-                duration_minutes=181,
-                genre="Action",
-                rating="PG-13",
-                cast=["Robert Downey Jr.", "Chris Evans", "Mark Ruffalo", "Chris Hemsworth", "Scarlett Johansson"],
-                director="Anthony Russo, Joe Russo",
-                writers=["Christopher Markus", "Stephen McFeely"],
-                producers=["Kevin Feige"],
-                release_date=date(2019, 4, 26),
-                country="USA",
-                language="English",
-                budget=356000000,
-                revenue=2797800564,
-                production_company="Marvel Studios",
-                distributor="Walt Disney Studios",
-                image_url="https://image.tmdb.org/t/p/w500/or06FN3Dka5tukK1e9sl16pB3iy.jpg",
-                trailer_url="https://www.youtube.com/watch?v=TcMBFSGVi1c",
-                awards=["Nominated for Best Visual Effects"],
-                details={"imdb_rating": 8.4, "mcu_phase": 3, "highest_grossing_film": True}
-            ),
-            Movie(
-                title="Joker",
-                description="In Gotham City, mentally troubled comedian Arthur Fleck is disregarded and mistreated by society. He then embarks on a downward spiral of revolution and bloody crime.",
-                duration_minutes=122,
-                genre="Drama",
-                rating="R",
-                cast=["Joaquin Phoenix", "Robert De Niro", "Zazie Beetz", "Frances Conroy"],
-                director="Todd Phillips",
-                writers=["Todd Phillips", "Scott Silver"],
-                producers=["Todd Phillips", "Bradley Cooper", "Emma Tillinger Koskoff"],
-                release_date=date(2019, 10, 4),
-                country="USA",
-                language="English",
-                budget=55000000,
-                revenue=1074251311,
-                production_company="Warner Bros. Pictures",
-                distributor="Warner Bros. Pictures",
-                image_url="https://image.tmdb.org/t/p/w500/udDclJoHjfjb8Ekgsd4FDteOkCU.jpg",
-                trailer_url="https://www.youtube.com/watch?v=zAGVQLHvwOY",
-                awards=["Academy Award for Best Actor (Joaquin Phoenix)", "Golden Lion at Venice"],
-                details={"imdb_rating": 8.4, "controversial": True}
-            ),
-            Movie(
-                title="Dune",
-                description="A noble family becomes embroiled in a war for control over the galaxy's most valuable asset while its heir becomes troubled by visions of a dark future.",
-                duration_minutes=155,
-                genre="Sci-Fi",
-                rating="PG-13",
-                cast=["Timothée Chalamet", "Rebecca Ferguson", "Oscar Isaac", "Josh Brolin", "Zendaya"],
-                director="Denis Villeneuve",
-                writers=["Jon Spaihts", "Denis Villeneuve", "Eric Roth"],
-                producers=["Mary Parent", "Cale Boyter", "Denis Villeneuve"],
-                release_date=date(2021, 10, 22),
-                country="USA",
-                language="English",
-                budget=165000000,
-                revenue=400700000,
-                production_company="Legendary Pictures",
-                distributor="Warner Bros. Pictures",
-                image_url="https://image.tmdb.org/t/p/w500/d5NXSklXo0qyIYkgV94XAgMIckC.jpg",
-                trailer_url="https://www.youtube.com/watch?v=8g18jFHCLXk",
-                awards=["Academy Award for Best Cinematography", "Academy Award for Best Original Score"],
-                details={"imdb_rating": 8.0, "based_on_novel": True}
-            ),
-            Movie(
-                title="Spider-Man: No Way Home",
-                description="With Spider-Man's identity now revealed, Peter asks Doctor Strange for help. When a spell goes wrong, dangerous foes from other worlds start to appear.",
-                duration_minutes=148,
-                genre="Action",
-                rating="PG-13",
-                cast=["Tom Holland", "Zendaya", "Benedict Cumberbatch", "Jacob Batalon"],
-                director="Jon Watts",
-                writers=["Chris McKenna", "Erik Sommers"],
-                producers=["Kevin Feige", "Amy Pascal"],
-                release_date=date(2021, 12, 17),
-                country="USA",
-                language="English",
-                budget=200000000,
-                revenue=1916000000,
-                production_company="Marvel Studios",
-                distributor="Sony Pictures",
-                image_url="https://image.tmdb.org/t/p/w500/1g0dhYtq4irTY1GPXvft6k4YLjm.jpg",
-                trailer_url="https://www.youtube.com/watch?v=JfVOs4VSpmA",
-                awards=["Nominated for Best Visual Effects"],
-                details={"imdb_rating": 8.2, "mcu_phase": 4, "multiverse": True}
-            ),
-            Movie(
-                title="The Shawshank Redemption",
-                description="Two imprisoned men bond over a number of years, finding solace and eventual redemption through acts of common decency.",
-                duration_minutes=142,
-                genre="Drama",
-                rating="R",
-                cast=["Tim Robbins", "Morgan Freeman", "Bob Gunton", "William Sadler"],
-                director="Frank Darabont",
-                writers=["Frank Darabont", "Stephen King"],
-                producers=["Niki Marvin"],
-                release_date=date(1994, 9, 23),
-                country="USA",
-                language="English",
-                budget=25000000,
-                revenue=28341469,
-                production_company="Castle Rock Entertainment",
-                distributor="Columbia Pictures",
-                image_url="https://image.tmdb.org/t/p/w500/q6y0Go1tsGEsmtFryDOJo3dEmqu.jpg",
-                trailer_url="https://www.youtube.com/watch?v=6hB3S9bIaco",
-                awards=["Nominated for 7 Academy Awards"],
-                details={"imdb_rating": 9.3, "based_on_stephen_king": True}
-            ),
-            Movie(
-                title="Forrest Gump",
-                description="The presidencies of Kennedy and Johnson, the Vietnam War, and other historical events unfold from the perspective of an Alabama man with an IQ of 75.",
-                duration_minutes=142,
-                genre="Drama",
-                rating="PG-13",
-                cast=["Tom Hanks", "Robin Wright", "Gary Sinise", "Sally Field"],
-                director="Robert Zemeckis",
-                writers=["Eric Roth"],
-                producers=["Wendy Finerman", "Steve Tisch", "Steve Starkey"],
-                release_date=date(1994, 7, 6),
-                country="USA",
-                language="English",
-                budget=55000000,
-                revenue=678200000,
-                production_company="Paramount Pictures",
-                distributor="Paramount Pictures",
-                image_url="https://image.tmdb.org/t/p/w500/saHP97rTPS5eLmrLQEcANmKrsFl.jpg",
-                trailer_url="https://www.youtube.com/watch?v=bLvqoHBptjg",
-                awards=["Academy Award for Best Picture", "Academy Award for Best Actor (Tom Hanks)"],
-                details={"imdb_rating": 8.8, "iconic_quotes": True}
-            ),
-            Movie(
-                title="Gladiator",
-                description="A former Roman General sets out to exact vengeance against the corrupt emperor who murdered his family and sent him into slavery.",
-                duration_minutes=155,
-                genre="Action",
-                rating="R",
-                cast=["Russell Crowe", "Joaquin Phoenix", "Connie Nielsen", "Oliver Reed"],
-                director="Ridley Scott",
-                writers=["David Franzoni", "John Logan", "William Nicholson"],
-                producers=["Douglas Wick", "David Franzoni", "Branko Lustig"],
-                release_date=date(2000, 5, 5),
-                country="USA",
-                language="English",
-                budget=103000000,
-                revenue=460583960,
-                production_company="DreamWorks Pictures",
-                distributor="Universal Pictures",
-                image_url="https://image.tmdb.org/t/p/w500/ty8TGRuvJLPUmAR1H1nRIsgwvim.jpg",
-                trailer_url="https://www.youtube.com/watch?v=owK1qxDselE",
-                awards=["Academy Award for Best Picture", "Academy Award for Best Actor (Russell Crowe)"],
-                details={"imdb_rating": 8.5, "historical_epic": True}
-            ),
-            Movie(
-                title="The Lion King",
-                description="Lion prince Simba and his father are targeted by his bitter uncle, who wants to ascend the throne himself.",
-                duration_minutes=88,
-                genre="Animation",
-                rating="G",
-                cast=["Matthew Broderick", "James Earl Jones", "Jeremy Irons", "Moira Kelly"],
-                director="Roger Allers, Rob Minkoff",
-                writers=["Irene Mecchi", "Jonathan Roberts", "Linda Woolverton"],
-                producers=["Don Hahn"],
-                release_date=date(1994, 6, 24),
-                country="USA",
-                language="English",
-                budget=45000000,
-                revenue=968500000,
-                production_company="Walt Disney Pictures",
-                distributor="Buena Vista Pictures",
-                image_url="https://image.tmdb.org/t/p/w500/sKCr78MXSLixwmZ8DyJLrpMsd15.jpg",
-                trailer_url="https://www.youtube.com/watch?v=4CbLXeGSDxg",
-                awards=["Academy Award for Best Original Score", "Academy Award for Best Original Song"],
-                details={"imdb_rating": 8.5, "disney_renaissance": True}
-            ),
-            Movie(
-                title="Oppenheimer",
-                description="The story of American scientist J. Robert Oppenheimer and his role in the development of the atomic bomb.",
-                duration_minutes=180,
-                genre="Biography",
-                rating="R",
-                cast=["Cillian Murphy", "Emily Blunt", "Matt Damon", "Robert Downey Jr.", "Florence Pugh"],
-                director="Christopher Nolan",
-                writers=["Christopher Nolan"],
-                producers=["Emma Thomas", "Christopher Nolan", "Charles Roven"],
-                release_date=date(2023, 7, 21),
-                country="USA",
-                language="English",
-                budget=100000000,
-                revenue=952000000,
-                production_company="Universal Pictures",
-                distributor="Universal Pictures",
-                image_url="https://image.tmdb.org/t/p/w500/8Gxv8gSFCU0XGDykEGv7zR1n2ua.jpg",
-                trailer_url="https://www.youtube.com/watch?v=uYPbbksJxIg",
-                awards=["Academy Award for Best Picture", "Academy Award for Best Director", "Academy Award for Best Actor"],
-                details={"imdb_rating": 8.3, "biographical": True, "imax_filmed": True}
-            )
-        ]
-        
-        for movie in movies:
-            session.add(movie)
-        session.commit()
-        
-        for movie in movies:
-            session.refresh(movie)
-            print(f"   ✓ Created movie: {movie.title}")
-        
+        movies = _load_movies()
+        movie_ids = _insert_movies(session, movies)
+
+        print(f"   ✓ Created {len(movie_ids)} movies")
+
         # Create screenings (tomorrow and day after tomorrow for all cinemas)
         print("\n📅 Creating screenings...")
-        base_date = datetime.now() + timedelta(days=1)
-        screening_count = 0
-        all_screenings = []
-
-        for day in range(7):  # Next 7 days
-            current_date = base_date + timedelta(days=day)
-
-            # Morning, afternoon, evening, night showtimes
-            times = [10, 14, 18, 21]
-
-            # Rotate through movies and rooms
-            for idx, movie in enumerate(movies[:10]):  # Use first 10 movies
-                room = rooms[idx % len(rooms)]
-
-                for time_hour in times:
-                    screening_time = current_date.replace(hour=time_hour, minute=0, second=0)
-
-                    # IMAX/Premium rooms cost more
-                    if "IMAX" in room.name or "Premium" in room.name:
-                        base_price = 20.0
-                    elif "4DX" in room.name:
-                        base_price = 25.0
-                    else:
-                        base_price = 15.0
-
-                    # Evening/night shows cost more
-                    price = base_price + 3.0 if time_hour >= 18 else base_price
-
-                    screening = Screening(
-                        movie_id=movie.id,
-                        room_id=room.id,
-                        screening_time=screening_time,
-                        price=price
-                    )
-                    session.add(screening)
-                    all_screenings.append(screening)
-                    screening_count += 1
+        # One clock reading shared by the showtimes and the sample tickets
+        now = datetime.now()
+        base_date = now + timedelta(days=1)
+        # Upcoming movies never get showtimes, so drop them once up front
+        released_movie_ids = _released_movie_ids(
+            movie_ids, [movie.release_date for movie in movies], base_date.date()
+        )
+        # Use first 10 released movies
+        screened_movie_ids = released_movie_ids[:10]
+        # Rotate through movies and rooms; each movie keeps its room (and so
+        # its base price) every day, so pair them up once
+        movie_rooms = [
+            (movie_id, room.id, _room_base_price(room.name))
+            for movie_id, room in zip(screened_movie_ids, itertools.cycle(rooms))
+        ]
 
-        session.commit()
+        # Showtimes depend only on the day, not the movie, so build them once
+        daily_slots = [
+            [
+                (datetime.combine((base_date + timedelta(days=day)).date(), time(time_hour)), surcharge)
+                for time_hour, surcharge in _SHOWTIME_SURCHARGES.items()
+            ]
+            for day in range(7)  # Next 7 days
+        ]
 
-        # Refresh all screenings to get their IDs
-        for screening in all_screenings:
-            session.refresh(screening)
+        # Ordered day -> movie -> showtime; the sample tickets index into it
+        screening_rows = [
+            {
+                "movie_id": movie_id,
+                "room_id": room_id,
+                "screening_time": screening_time,
+                "price": base_price + surcharge,
+            }
+            for slots in daily_slots
+            for movie_id, room_id, base_price in movie_rooms
+            for screening_time, surcharge in slots
+        ]
+
+        # One executemany for every showtime; RETURNING hands back the ids in
+        # row order so the tickets below need no per-screening refresh
+        screening_ids = session.execute(
+            insert(Screening).returning(Screening.id, sort_by_parameter_order=True),
+            screening_rows,
+        ).scalars().all()
+        screening_count = len(screening_ids)
 
         print(f"   ✓ Created {screening_count} screenings")
 
         # Create cast members for movies
         print("\n🎭 Creating cast members...")
-        cast_members = [
-            # The Matrix
-            Cast(name="Keanu Reeves", movie_id=movies[0].id, actor_name="Keanu Reeves", role="Neo", is_lead=True, order=1, profile_image_url="https://image.tmdb.org/t/p/w500/rRdru6REr9i3WIHv2mntpcgxnoY.jpg"),
-            Cast(name="Laurence Fishburne", movie_id=movies[0].id, actor_name="Laurence Fishburne", role="Morpheus", is_lead=True, order=2, profile_image_url="https://image.tmdb.org/t/p/w500/8suOhUmPbfKqDQ17bR0Vst35nk4.jpg"),
-            Cast(name="Carrie-Anne Moss", movie_id=movies[0].id, actor_name="Carrie-Anne Moss", role="Trinity", is_lead=True, order=3, profile_image_url="https://image.tmdb.org/t/p/w500/xD4jTA3KmVp5Rq3aHcymL9DUGjD.jpg"),
-            # Inception
-            Cast(name="Leonardo DiCaprio", movie_id=movies[1].id, actor_name="Leonardo DiCaprio", role="Dom Cobb", is_lead=True, order=1, profile_image_url="https://image.tmdb.org/t/p/w500/wo2hJpn04vbtmh0B9utCFdsQhxM.jpg"),
-            Cast(name="Joseph Gordon-Levitt", movie_id=movies[1].id, actor_name="Joseph Gordon-Levitt", role="Arthur", is_lead=False, order=2, profile_image_url="https://image.tmdb.org/t/p/w500/z2FA8js799xqtfiFjBTicFYdfk.jpg"),
-            # The Dark Knight
-            Cast(name="Christian Bale", movie_id=movies[2].id, actor_name="Christian Bale", role="Bruce Wayne / Batman", is_lead=True, order=1, profile_image_url="https://image.tmdb.org/t/p/w500/vecCvACI30scbblvQ8LDOuSBu87.jpg"),
-            Cast(name="Heath Ledger", movie_id=movies[2].id, actor_name="Heath Ledger", role="Joker", is_lead=True, order=2, profile_image_url="https://image.tmdb.org/t/p/w500/5Y9HnYYa9jF4NunY9lSgJGjSe8E.jpg"),
-            # Oppenheimer
-            Cast(name="Cillian Murphy", movie_id=movies[10].id, actor_name="Cillian Murphy", role="J. Robert Oppenheimer", is_lead=True, order=1, profile_image_url="https://image.tmdb.org/t/p/w500/dm6V24NjjvjMiCtbMkc8Y2WPm2e.jpg"),
-            Cast(name="Emily Blunt", movie_id=movies[10].id, actor_name="Emily Blunt", role="Kitty Oppenheimer", is_lead=False, order=2, profile_image_url="https://image.tmdb.org/t/p/w500/5nCSG5TL1bP1geD8aaBfaRzbH1k.jpg"),
-        ]
-
-        for cast in cast_members:
-            session.add(cast)
-        session.commit()
+        movie_ids_by_title = {movie.title: movie_id for movie, movie_id in zip(movies, movie_ids)}
+
+        cast_members = _load_cast()
+
+        # Nothing references the cast ids, so the rows can be streamed with COPY;
+        # COPY skips Python-side column defaults, so the timestamps are sent explicitly
+        cast_timestamp = datetime.utcnow()
+        _copy_rows(
+            session,
+            Cast,
+            (
+                "movie_id", "actor_name", "character_name", "role", "is_lead", "order",
+                "profile_image_url", "created_at", "updated_at",
+            ),
+            (
+                (
+                    movie_ids_by_title[movie], actor_name, character_name, "Actor", is_lead, order,
+                    profile_image_url, cast_timestamp, cast_timestamp,
+                )
+                for movie, actor_name, character_name, is_lead, order, profile_image_url in cast_members
+            ),
+        )
         print(f"   ✓ Created {len(cast_members)} cast members")
 
         # Create reviews
         print("\n⭐ Creating reviews...")
         reviews = [
-            Review(user_id=users[1].id, movie_id=movies[0].id, rating=5, title="Mind-blowing!", comment="The Matrix changed cinema forever. A masterpiece of sci-fi.", likes=42, dislikes=2),
-            Review(user_id=users[2].id, movie_id=movies[0].id, rating=4, title="Great action", comment="Loved the action sequences and the concept.", likes=28, dislikes=1),
-            Review(user_id=users[3].id, movie_id=movies[1].id, rating=5, title="Nolan's best work", comment="Inception is a complex and brilliant film. The ending is perfect.", likes=95, dislikes=3),
-            Review(user_id=users[1].id, movie_id=movies[2].id, rating=5, title="Heath Ledger was incredible", comment="The Dark Knight is the best superhero movie ever made.", likes=156, dislikes=5),
-            Review(user_id=users[2].id, movie_id=movies[2].id, rating=5, title="Perfect Batman film", comment="Everything about this movie is perfect.", likes=89, dislikes=2),
-            Review(user_id=users[3].id, movie_id=movies[3].id, rating=4, title="Visually stunning", comment="Interstellar is a beautiful and emotional journey through space.", likes=67, dislikes=4),
-            Review(user_id=users[1].id, movie_id=movies[5].id, rating=5, title="Absolutely brilliant", comment="Parasite is a masterclass in filmmaking. Deserved all the awards.", likes=103, dislikes=1),
-            Review(user_id=users[2].id, movie_id=movies[6].id, rating=5, title="Epic conclusion", comment="Endgame was everything I hoped for and more.", likes=134, dislikes=8),
-            Review(user_id=users[3].id, movie_id=movies[7].id, rating=5, title="Joaquin Phoenix is phenomenal", comment="This movie is dark and powerful. Phoenix's performance is unforgettable.", likes=98, dislikes=12),
-            Review(user_id=users[1].id, movie_id=movies[10].id, rating=5, title="Nolan does it again", comment="Oppenheimer is a historical epic that everyone should see.", likes=76, dislikes=3),
+            # (user, movie, rating, title, comment, likes, dislikes)
+            (users[1].id, "The Matrix", 5, "Mind-blowing!", "The Matrix changed cinema forever. A masterpiece of sci-fi.", 42, 2),
+            (users[2].id, "The Matrix", 4, "Great action", "Loved the action sequences and the concept.", 28, 1),
+            (users[3].id, "Inception", 5, "Nolan's best work", "Inception is a complex and brilliant film. The ending is perfect.", 95, 3),
+            (users[1].id, "The Dark Knight", 5, "Heath Ledger was incredible", "The Dark Knight is the best superhero movie ever made.", 156, 5),
+            (users[2].id, "The Dark Knight", 5, "Perfect Batman film", "Everything about this movie is perfect.", 89, 2),
+            (users[3].id, "Interstellar", 4, "Visually stunning", "Interstellar is a beautiful and emotional journey through space.", 67, 4),
+            (users[1].id, "Parasite", 5, "Absolutely brilliant", "Parasite is a masterclass in filmmaking. Deserved all the awards.", 103, 1),
+            (users[2].id, "Avengers: Endgame", 5, "Epic conclusion", "Endgame was everything I hoped for and more.", 134, 8),
+            (users[3].id, "Joker", 5, "Joaquin Phoenix is phenomenal", "This movie is dark and powerful. Phoenix's performance is unforgettable.", 98, 12),
+            (users[1].id, "Oppenheimer", 5, "Nolan does it again", "Oppenheimer is a historical epic that everyone should see.", 76, 3),
         ]
 
-        for review in reviews:
-            session.add(review)
-        session.commit()
+        # Curated rows: insert in one executemany without per-instance validation
+        session.execute(
+            insert(Review),
+            [
+                {
+                    "user_id": user_id,
+                    "movie_id": movie_ids_by_title[title],
+                    "rating": rating,
+                    "title": review_title,
+                    "comment": comment,
+                    "likes": likes,
+                    "dislikes": dislikes,
+                }
+                for user_id, title, rating, review_title, comment, likes, dislikes in reviews
+            ],
+        )
         print(f"   ✓ Created {len(reviews)} reviews")
 
         # Create favorites
         print("\n❤️ Creating favorites...")
         favorites = [
-            Favorite(user_id=users[1].id, cinema_id=cinemas[0].id),
-            Favorite(user_id=users[1].id, cinema_id=cinemas[3].id),
-            Favorite(user_id=users[2].id, cinema_id=cinemas[1].id),
-            Favorite(user_id=users[2].id, cinema_id=cinemas[4].id),
-            Favorite(user_id=users[3].id, cinema_id=cinemas[0].id),
-            Favorite(user_id=users[3].id, cinema_id=cinemas[2].id),
+            # (user, cinema)
+            (users[1].id, cinemas[0].id),
+            (users[1].id, cinemas[3].id),
+            (users[2].id, cinemas[1].id),
+            (users[2].id, cinemas[4].id),
+            (users[3].id, cinemas[0].id),
+            (users[3].id, cinemas[2].id),
         ]
 
-        for favorite in favorites:
-            session.add(favorite)
-        session.commit()
+        session.execute(
+            insert(Favorite),
+            [{"user_id": user_id, "cinema_id": cinema_id} for user_id, cinema_id in favorites],
+        )
         print(f"   ✓ Created {len(favorites)} favorites")
 
         # Create search history
         print("\n🔍 Creating search history...")
         search_history = [
-            SearchHistory(user_id=users[1].id, search_query="action movies", search_type="movie"),
-            SearchHistory(user_id=users[1].id, search_query="Nolan", search_type="director"),
-            SearchHistory(user_id=users[1].id, search_query="Tunis cinemas", search_type="cinema"),
-            SearchHistory(user_id=users[2].id, search_query="sci-fi", search_type="genre"),
-            SearchHistory(user_id=users[2].id, search_query="IMAX", search_type="cinema"),
-            SearchHistory(user_id=users[3].id, search_query="The Dark Knight", search_type="movie"),
-            SearchHistory(user_id=users[3].id, search_query="Christopher Nolan", search_type="director"),
+            # (user, query, type)
+            (users[1].id, "action movies", "movie"),
+            (users[1].id, "Nolan", "director"),
+            (users[1].id, "Tunis cinemas", "cinema"),
+            (users[2].id, "sci-fi", "genre"),
+            (users[2].id, "IMAX", "cinema"),
+            (users[3].id, "The Dark Knight", "movie"),
+            (users[3].id, "Christopher Nolan", "director"),
         ]
 
-        for search in search_history:
-            session.add(search)
-        session.commit()
+        session.execute(
+            insert(SearchHistory),
+            [
+                {"user_id": user_id, "search_query": search_query, "search_type": search_type}
+                for user_id, search_query, search_type in search_history
+            ],
+        )
         print(f"   ✓ Created {len(search_history)} search history entries")
 
         # Create sample tickets
         print("\n🎫 Creating sample tickets...")
         tickets = [
-            Ticket(user_id=users[1].id, screening_id=all_screenings[0].id, seat_id=1, price=all_screenings[0].price, status="confirmed", confirmed_at=datetime.now() - timedelta(days=2)),
-            Ticket(user_id=users[1].id, screening_id=all_screenings[5].id, seat_id=25, price=all_screenings[5].price, status="confirmed", confirmed_at=datetime.now() - timedelta(days=1)),
-            Ticket(user_id=users[2].id, screening_id=all_screenings[1].id, seat_id=50, price=all_screenings[1].price, status="pending"),
-            Ticket(user_id=users[2].id, screening_id=all_screenings[2].id, seat_id=75, price=all_screenings[2].price, status="confirmed", confirmed_at=datetime.now() - timedelta(hours=5)),
-            Ticket(user_id=users[3].id, screening_id=all_screenings[10].id, seat_id=100, price=all_screenings[10].price, status="confirmed", confirmed_at=datetime.now() - timedelta(hours=12)),
+            # (user, screening index, seat, status, confirmed at)
+            (users[1].id, 0, 1, "confirmed", now - timedelta(days=2)),
+            (users[1].id, 5, 25, "confirmed", now - timedelta(days=1)),
+            (users[2].id, 1, 50, "pending", None),
+            (users[2].id, 2, 75, "confirmed", now - timedelta(hours=5)),
+            (users[3].id, 10, 100, "confirmed", now - timedelta(hours=12)),
         ]
 
-        for ticket in tickets:
-            session.add(ticket)
-        session.commit()
+        session.execute(
+            insert(Ticket),
+            [
+                {
+                    "user_id": user_id,
+                    "screening_id": screening_ids[screening],
+                    "seat_id": seat_id,
+                    "price": screening_rows[screening]["price"],
+                    "status": status,
+                    "confirmed_at": confirmed_at,
+                }
+                for user_id, screening, seat_id, status, confirmed_at in tickets
+            ],
+        )
         print(f"   ✓ Created {len(tickets)} tickets")
 
+        # Every stage above runs in this one transaction, so a failure part-way
+        # leaves the database untouched
+        session.commit()
+
         print("\n✅ Database seeding completed successfully!")
         print(f"\n📊 Summary:")
         print(f"   - {len(users)} users (1 admin, {len(users)-1} regular)")
         print(f"   - {len(cinemas)} cinemas across {len(set([c.city for c in cinemas]))} cities")
         print(f"   - {len(rooms)} rooms")
         print(f"   - {total_seats} seats")
-        print(f"   - {len(movies)} movies (with enhanced details)")
+        print(f"   - {len(movie_ids)} movies (with enhanced details)")
         print(f"   - {screening_count} screenings")
         print(f"   - {len(cast_members)} cast members")
         print(f"   - {len(reviews)} reviews")
@@ -782,16 +605,7 @@ def seed_database():
 if __name__ == "__main__":
     with Session(engine) as session:
         print("🧹 Deleting previous data...")
-
-        # Delete screenings first (due to foreign key constraints)
-        session.exec(text('DELETE FROM screening'))
-        session.exec(text('DELETE FROM seat'))
-        session.exec(text('DELETE FROM room'))
-        session.exec(text('DELETE FROM movie'))
-        session.exec(text('DELETE FROM cinema'))
-        session.exec(text('DELETE FROM "user"'))
-        session.commit()
-
+        clear_database(session)
         print("   ✓ All previous data deleted")
 
     seed_database()
@@ -0,0 +1,218 @@
+"""Tests for the database seeding script."""
+
+from collections import namedtuple
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session, select, func
+
+import seed
+from app.models import User, Cinema, Room, Seat, Movie, Screening, Ticket
+from app.models.cast import Cast
+from app.models.review import Review
+from app.models.favorite import Favorite
+from app.models.search_history import SearchHistory
+
+
+FakeRoom = namedtuple("FakeRoom", ["id", "name"])
+
+EXPECTED_COUNTS = {
+    User: 4,
+    Cinema: 5,
+    Room: 12,
+    Seat: 1648,
+    Movie: 15,
+    Screening: 280,
+    Cast: 9,
+    Review: 10,
+    Favorite: 6,
+    SearchHistory: 7,
+    Ticket: 5,
+}
+
+
+class FakeCopyCursor:
+    """DBAPI cursor stand-in that records what ``copy_expert`` was given."""
+
+    def __init__(self):
+        self.copies = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def copy_expert(self, sql, file):
+        self.copies.append((sql, file.read()))
+
+
+def postgres_session(cursor):
+    """Return a session stand-in whose connection reports the PostgreSQL dialect."""
+    connection = SimpleNamespace(
+        dialect=SimpleNamespace(
+            name="postgresql",
+            identifier_preparer=postgresql.dialect().identifier_preparer,
+        ),
+        connection=SimpleNamespace(cursor=lambda: cursor),
+    )
+    return SimpleNamespace(connection=lambda: connection)
+
+
+def count_rows(session: Session, model) -> int:
+    """Return the number of rows in the table of ``model``."""
+    return session.exec(select(func.count()).select_from(model)).one()
+
+
+@pytest.fixture(name="seed_engine")
+def seed_engine_fixture(session: Session, monkeypatch):
+    """Point ``seed_database`` at the in-memory test database."""
+    monkeypatch.setattr(seed, "engine", session.get_bind())
+    return session.get_bind()
+
+
+def test_copy_value_escapes_metacharacters():
+    """Test COPY rendering escapes tab, newline, carriage return and backslash."""
+    assert seed._copy_value("a\tb\nc\rd\\e") == "a\\tb\\nc\\rd\\\\e"
+    assert seed._copy_value("plain text") == "plain text"
+
+
+def test_copy_value_renders_null_and_scalars():
+    """Test COPY rendering of None, numbers and booleans."""
+    assert seed._copy_value(None) == "\\N"
+    assert seed._copy_value(42) == "42"
+    assert seed._copy_value(2.5) == "2.5"
+    assert seed._copy_value(True) == "True"
+
+
+def test_copy_stream_read_all():
+    """Test reading the whole stream renders one tab-separated line per row."""
+    stream = seed._CopyStream([(1, "A", None), (2, "B\tC", "x")])
+    assert stream.read() == "1\tA\t\\N\n2\tB\\tC\tx\n"
+    assert stream.read() == ""
+
+
+def test_copy_stream_read_in_chunks():
+    """Test chunked reads add up to the fully rendered text."""
+    rows = [(room_id, "row", seat, "standard") for room_id in range(5) for seat in range(20)]
+    full = seed._CopyStream(rows).read()
+
+    stream = seed._CopyStream(rows)
+    chunks = []
+    while True:
+        chunk = stream.read(7)
+        if not chunk:
+            break
+        assert len(chunk) <= 7
+        chunks.append(chunk)
+    assert "".join(chunks) == full
+
+
+def test_copy_rows_empty_input_inserts_nothing(session: Session):
+    """Test the executemany fallback writes no rows for an empty iterable."""
+    seed._copy_rows(session, Seat, ("room_id", "row_label", "seat_number", "seat_type"), iter(()))
+    assert count_rows(session, Seat) == 0
+
+
+def test_copy_rows_postgres_streams_copy():
+    """Test the PostgreSQL branch sends one COPY with quoted reserved names."""
+    cursor = FakeCopyCursor()
+    created = datetime(2025, 1, 2, 3, 4, 5)
+    columns = (
+        "movie_id", "actor_name", "character_name", "role", "is_lead", "order",
+        "profile_image_url", "created_at", "updated_at",
+    )
+    row = (7, "Keanu Reeves", "Neo", "Actor", True, 1, None, created, created)
+
+    seed._copy_rows(postgres_session(cursor), Cast, columns, iter([row]))
+
+    assert cursor.copies == [(
+        'COPY "cast" (movie_id, actor_name, character_name, role, is_lead, "order", '
+        "profile_image_url, created_at, updated_at) FROM STDIN",
+        "7\tKeanu Reeves\tNeo\tActor\tTrue\t1\t\\N\t"
+        "2025-01-02 03:04:05\t2025-01-02 03:04:05\n",
+    )]
+
+
+def test_seat_coords_standard_layout():
+    """Test a standard room has its last two rows VIP."""
+    coords = seed._seat_coords(8, 12, False)
+    assert len(coords) == 96
+    assert coords[0] == ("A", 1, "standard")
+    assert coords[-1] == ("H", 12, "vip")
+    vip_rows = {row_label for row_label, _, seat_type in coords if seat_type == "vip"}
+    assert vip_rows == {"G", "H"}
+
+
+def test_seat_coords_all_vip_layout():
+    """Test a VIP room has only VIP seats."""
+    coords = seed._seat_coords(8, 12, True)
+    assert {seat_type for _, _, seat_type in coords} == {"vip"}
+
+
+def test_iter_seat_rows_counts_per_room():
+    """Test seat counts follow each room's layout."""
+    rooms = [
+        FakeRoom(1, "Room 1"),
+        FakeRoom(2, "IMAX Hall"),
+        FakeRoom(3, "Premium 1"),
+        FakeRoom(4, "4DX Screen"),
+        FakeRoom(5, "VIP Lounge"),
+    ]
+    seats = list(seed._iter_seat_rows(rooms))
+
+    counts = {}
+    for room_id, _, _, _ in seats:
+        counts[room_id] = counts.get(room_id, 0) + 1
+    assert counts == {1: 96, 2: 240, 3: 160, 4: 240, 5: 96}
+    assert all(seat_type == "vip" for room_id, _, _, seat_type in seats if room_id == 5)
+
+
+def test_seed_database(session: Session, seed_engine):
+    """Test a full seed on SQLite creates every table's rows."""
+    seed.seed_database()
+
+    for model, expected in EXPECTED_COUNTS.items():
+        assert count_rows(session, model) == expected, model.__name__
+
+
+def test_seed_database_links_tickets(session: Session, seed_engine):
+    """Test seeded tickets point at real screenings and seats and use their price."""
+    seed.seed_database()
+
+    tickets = session.exec(select(Ticket)).all()
+    assert tickets
+    for ticket in tickets:
+        screening = session.get(Screening, ticket.screening_id)
+        assert screening is not None
+        assert ticket.price == screening.price
+        assert session.get(Seat, ticket.seat_id) is not None
+
+
+def test_seed_database_skips_when_seeded(session: Session, seed_engine):
+    """Test seeding twice does not duplicate data."""
+    seed.seed_database()
+    seed.seed_database()
+
+    assert count_rows(session, Cinema) == EXPECTED_COUNTS[Cinema]
+    assert count_rows(session, Screening) == EXPECTED_COUNTS[Screening]
+
+
+def test_clear_database_then_reseed(session: Session, seed_engine):
+    """Test clearing empties every table and a reseed lines the ticket seats up again."""
+    seed.seed_database()
+    seed.clear_database(session)
+
+    for model in EXPECTED_COUNTS:
+        assert count_rows(session, model) == 0, model.__name__
+
+    seed.seed_database()
+
+    for model, expected in EXPECTED_COUNTS.items():
+        assert count_rows(session, model) == expected, model.__name__
+    # The sample tickets use hard-coded seat ids, which must exist after a reseed
+    for ticket in session.exec(select(Ticket)).all():
+        assert session.get(Seat, ticket.seat_id) is not None
+        assert session.get(Screening, ticket.screening_id) is not None